@@ -24,10 +24,11 @@ def check_url(label, url, expect_json=True):
         r = requests.get(url, headers=HEADERS, timeout=15)
         ct = r.headers.get("Content-Type", "")
         size = len(r.content)
+        enc = r.headers.get("Content-Encoding", "identity")
         is_json = "json" in ct or (r.text.strip().startswith("{") or r.text.strip().startswith("["))
         status = "✅" if r.status_code == 200 else "❌"
         json_ok = "JSON✅" if (expect_json and is_json) else ("JSON❌" if expect_json else "")
-        print(f"  {status} [{r.status_code}] {json_ok} {size}B  {label}")
+        print(f"  {status} [{r.status_code}] {json_ok} {size}B ({enc})  {label}")
         print(f"       URL: {url}")
         if r.status_code == 200 and is_json:
             try:
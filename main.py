@@ -22,35 +22,33 @@ def main():
     # 1. Boot up the database
     init_db()
 
-    # 2. Scrape all companies
-    all_jobs = scrape_all()
-
-    # 3. Filter → only AI / ML / Data / SDE roles
-    relevant = [j for j in all_jobs if is_relevant(j["title"])]
-    print(f"\n[Filter] Relevant jobs after keyword filter: {len(relevant)}")
-
-    # 4. For each relevant job — check if NEW, then save + alert
-    new_count = 0
-    for job in relevant:
-        link = job.get("link", "")
-        if not link:
-            continue  # skip jobs with no link
-
-        if is_new_job(link):
+    # 2. Scrape all companies — jobs stream in as each scraper finishes
+    relevant_count = 0
+    new_count      = 0
+    for job in scrape_all():
+        # 3. Filter → only AI / ML / Data / SDE roles
+        if not is_relevant(job.title):
+            continue
+        relevant_count += 1
+
+        # 4. Check if NEW, then save + alert
+        if is_new_job(job.link):
             save_job(
-                company  = job["company"],
-                title    = job["title"],
-                location = job.get("location", ""),
-                link     = link,
+                company  = job.company,
+                title    = job.title,
+                location = job.location,
+                link     = job.link,
             )
             send_alert(
-                company  = job["company"],
-                title    = job["title"],
-                location = job.get("location", ""),
-                link     = link,
+                company  = job.company,
+                title    = job.title,
+                location = job.location,
+                link     = job.link,
             )
             new_count += 1
 
+    print(f"\n[Filter] Relevant jobs after keyword filter: {relevant_count}")
+
     # 5. Summary
     print("\n" + "=" * 55)
     print(f"  ✅ Done!  New jobs found & alerted: {new_count}")
@@ -14,15 +14,28 @@ ROOT CAUSE ANALYSIS OF ALL FAILURES:
    ✅ Fix: Scrape careers.swiggy.com's own API endpoint
 
 STRATEGY:
-  Each scraper has 2 layers:
+  Each scraper has 2 layers (shared in _scrape_layered):
     Layer 1 → JSON API (fast, clean)
     Layer 2 → HTML parse (fallback if API changes)
 """
 
-import json
+import codecs
+import functools
 import re
-import requests
-from bs4 import BeautifulSoup
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests_cache
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+
+try:
+    from orjson import loads as _json_loads   # C parser, 2–5x faster on big JSON payloads
+except ImportError:
+    from json import loads as _json_loads
 
 HEADERS = {
     "User-Agent": (
@@ -32,91 +45,397 @@ HEADERS = {
     ),
     "Accept":          "application/json, text/html, */*",
     "Accept-Language": "en-US,en;q=0.9",
-    "Accept-Encoding": "gzip, deflate, br",
+    # Only advertise codings urllib3 can actually decode here: "br" needs
+    # brotli and "zstd" needs urllib3's zstd extra, otherwise a server may
+    # send a body we'd hand to the parser still compressed.
+    "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
 }
 TIMEOUT = 20
 
 
+@dataclass(slots=True)
+class Job:
+    """One scraped posting. Slotted: far smaller than a 4-key dict per job."""
+    company:  str
+    title:    str
+    location: str
+    link:     str
+
+
+# Embedded-JS job patterns, compiled once instead of per <script> tag.
+# Each one starts at the "title" key so _scan_pairs can anchor it.
+_GOOGLE_JOB_RE = re.compile(r'"title"\s*:\s*"([^"]{5,80})".*?"job_id"\s*:\s*"([^"]+)"')
+_MS_JOB_RE     = re.compile(r'"title"\s*:\s*"([^"]+)"[^}]*"jobId"\s*:\s*"([^"]+)"')
+# Anchored on "title" rather than on "{": a leading `\{[^{}]*` retried from
+# every brace and went quadratic on large minified bundles. The middle
+# `[^{}]*` stays greedy so the last url/link/applyUrl key in the object wins.
+_ZOMATO_JOB_RE = re.compile(
+    r'"title"\s*:\s*"([^"]{4,80})"[^{}]*"(?:url|link|applyUrl)"\s*:\s*"([^"]+)"'
+)
+_SWIGGY_JOB_RE = re.compile(r'"title"\s*:\s*"([^"]+)"[^}]*"job_application_url"\s*:\s*"([^"]+)"')
+
+# Career-ish href keywords for the generic <a> fallbacks, one alternation each.
+_ZOMATO_ANCHOR_RE = re.compile(r"career|job|opening|role")
+_SWIGGY_ANCHOR_RE = re.compile(r"job|career|opening|apply")
+
+# One pooled session for every request: the fallback chains mostly hit the
+# same hosts, so keep-alive saves a TCP + TLS handshake per extra request.
+# GETs are also cached on disk for a few minutes, so re-running while
+# tweaking a parser doesn't re-download every careers page.
+CACHE_TTL = 600
+SESSION = requests_cache.CachedSession(
+    "scraper_cache",
+    expire_after=CACHE_TTL,
+    allowable_methods=("GET",),
+    stale_if_error=True,
+)
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+_CHARSET_RE      = re.compile(r"charset=[\"']?([\w.:-]+)", re.I)
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?([\w.:-]+)", re.I)
+
+
+def _charset(resp, markup: bytes) -> str:
+    """
+    Page encoding: the Content-Type charset, else a <meta charset> in the
+    first few KB of `markup`, else UTF-8. Names are only validated with
+    codecs.lookup; the page's own spelling (e.g. "euc-kr") is returned.
+    """
+    m = (_CHARSET_RE.search(resp.headers.get("Content-Type", "")) or
+         _META_CHARSET_RE.search(markup[:4096]))
+    if m:
+        name = m.group(1)
+        if isinstance(name, bytes):
+            name = name.decode("ascii")
+        try:
+            codecs.lookup(name)
+            return name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+@functools.cache
+def _page_xpath():
+    """Compiled `//script | //a[@href]`, built on first HTML fallback."""
+    from lxml import etree
+    return etree.XPath("//script | //a[@href]")
+
+
+def _parse_page(markup: bytes, charset: str = "utf-8"):
+    """
+    Parse an HTML page for the fallback layers in one libxml2 walk.
+    The bytes are decoded here as `charset` (see _charset) with invalid
+    sequences replaced, so one stray byte in an unrelated script can't
+    make lxml's lazy text decoding raise and sink the whole layer.
+    Returns (ld_json_texts, script_texts, anchor_elements) in document
+    order. lxml is imported here, not at module top, so runs where every
+    JSON API answers never pay for importing it.
+    """
+    from lxml import html as lxml_html
+    text = markup.decode(charset, errors="replace")
+    if text.lstrip().startswith("<?xml"):
+        # lxml refuses str input that still carries an encoding declaration
+        text = text[text.find("?>") + 2:]
+    root = lxml_html.document_fromstring(text)
+
+    ld_json, scripts, anchors = [], [], []
+    for el in _page_xpath()(root):
+        if el.tag == "script":
+            txt = el.text or ""
+            if el.get("type") == "application/ld+json":
+                ld_json.append(txt)
+            scripts.append(txt)
+        else:
+            anchors.append(el)
+    return ld_json, scripts, anchors
+
+
+def _fetch_until(url: str, sentinel: bytes, close: bytes = b"</script>",
+                 max_bytes: int = 2_000_000) -> tuple[bytes, str]:
+    """
+    Stream a page and stop once the <script> holding `sentinel` has closed.
+    The SPA careers pages run to megabytes, but the job blob sits well
+    before the end. Anything after that script is never seen, so callers
+    must not rely on later content such as JSON-LD blocks. Streamed pages
+    skip the response cache, which would otherwise read the whole body in
+    order to store it.
+    Returns the page up to and including that </script> (or whatever was
+    read when `max_bytes` hit first) and its charset (see _charset).
+    """
+    buf = bytearray()
+    with SESSION.get(url, stream=True, timeout=TIMEOUT,
+                     expire_after=requests_cache.DO_NOT_CACHE) as resp:
+        hit = -1
+        for chunk in resp.iter_content(65536):
+            start = max(len(buf) - len(sentinel), 0)
+            buf.extend(chunk)
+            if hit == -1:
+                hit = buf.find(sentinel, start)
+            if hit != -1:
+                end = buf.find(close, hit)
+                if end != -1:
+                    # Cut at the tag: the rest of the chunk may end mid-character
+                    page = bytes(buf[:end + len(close)])
+                    return page, _charset(resp, page)
+            if len(buf) > max_bytes:
+                break
+        page = bytes(buf)
+        return page, _charset(resp, page)
+
+
+def _first_api_hit(company: str, urls: list[str], parse, **get_kwargs) -> list[Job]:
+    """
+    Probe every candidate API URL at once and return the first non-empty
+    list that `parse(resp)` builds. Fallback latency becomes the slowest
+    probe rather than the sum of all of them.
+
+    Probes still in flight when a winner arrives are left running: a
+    blocking GET can't be interrupted, so each keeps its pooled
+    connection until it returns (at most TIMEOUT). When it does, its
+    response is closed unparsed, so it neither logs nor yields jobs.
+    """
+    done = threading.Event()
+
+    def probe(url):
+        resp = SESSION.get(url, timeout=TIMEOUT, **get_kwargs)
+        if done.is_set():
+            resp.close()
+            return []
+        return parse(resp)
+
+    pool    = ThreadPoolExecutor(max_workers=len(urls))
+    futures = {pool.submit(probe, url): url for url in urls}
+    try:
+        for fut in as_completed(futures):
+            try:
+                jobs = fut.result()
+            except Exception as e:
+                print(f"[Scraper] {company} endpoint failed: {e}")
+                continue
+            if jobs:
+                print(f"[Scraper] {company} API hit: {futures[fut]}")
+                return jobs
+    finally:
+        done.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+    return []
+
+
+# Every embedded-JS pattern starts at this key; matches never run past the window.
+_TITLE_KEY   = '"title"'
+_SCAN_WINDOW = 4096
+
+
+def _scan_pairs(txt: str, pattern: re.Pattern, limit: int) -> list[tuple[str, str]]:
+    """
+    Two-stage scan of a script body: str.find locates every "title" key,
+    then `pattern` is matched only in a bounded window at each one, so
+    the regex never walks a multi-megabyte bundle end to end.
+    Like findall, matches do not overlap.
+    """
+    pairs = []
+    pos   = txt.find(_TITLE_KEY)
+    while pos != -1 and len(pairs) < limit:
+        m = pattern.match(txt, pos, pos + _SCAN_WINDOW)
+        if m:
+            pairs.append(m.groups())
+            pos = m.end()
+        else:
+            pos += len(_TITLE_KEY)
+        pos = txt.find(_TITLE_KEY, pos)
+    return pairs
+
+
+# Inline scripts shorter than this are analytics/config stubs, never job data.
+_MIN_SCRIPT_LEN = 200
+
+
+def _iter_interesting_scripts(scripts: list[str], needles: tuple[str, ...]):
+    """
+    Yield the text of inline <script> tags that could hold job data.
+    Cheap length and substring gates skip the dozens of tiny tracking
+    tags on modern careers pages before any regex runs.
+    """
+    for txt in scripts:
+        if len(txt) < _MIN_SCRIPT_LEN:
+            continue
+        if any(txt.find(n) != -1 for n in needles):
+            yield txt
+
+
 # ─────────────────────────────────────────────────────────────────────
-# 1. GOOGLE  (working ✅ — keeping as-is)
+# SHARED LAYERED SCRAPER
 # ─────────────────────────────────────────────────────────────────────
 
-def scrape_google() -> list[dict]:
-    """Scrape Google Careers via their public HTML page + embedded JSON."""
+def _jsonld_jobs(ld_json: list[str], company: str) -> list[Job]:
+    """Pull schema.org JobPosting entries out of JSON-LD <script> bodies."""
     jobs = []
-    url  = "https://careers.google.com/jobs/results/?location=India&q=software+engineer+data+machine+learning"
+    for txt in ld_json:
+        try:
+            data  = _json_loads(txt)
+            items = data if isinstance(data, list) else [data]
+            for item in items:
+                if item.get("@type") == "JobPosting":
+                    title = item.get("title", "")
+                    link  = item.get("url", "")
+                    loc   = (item.get("jobLocation") or {})
+                    if isinstance(loc, list):
+                        loc = loc[0] if loc else {}
+                    location = loc.get("address", {}).get("addressLocality", "India")
+                    if title and link:
+                        jobs.append(Job(company=company, title=title,
+                                        location=location, link=link))
+        except Exception:
+            pass
+    return jobs
 
-    try:
-        resp = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
-        soup = BeautifulSoup(resp.text, "html.parser")
 
-        # Method A: JSON-LD structured data
-        for s in soup.find_all("script", type="application/ld+json"):
-            try:
-                data  = json.loads(s.string or "")
-                items = data if isinstance(data, list) else [data]
-                for item in items:
-                    if item.get("@type") == "JobPosting":
-                        title = item.get("title", "")
-                        link  = item.get("url", "")
-                        loc   = (item.get("jobLocation") or {})
-                        if isinstance(loc, list):
-                            loc = loc[0] if loc else {}
-                        location = loc.get("address", {}).get("addressLocality", "India")
-                        if title and link:
-                            jobs.append({"company": "Google", "title": title,
-                                         "location": location, "link": link})
-            except Exception:
-                pass
-
-        # Method B: embedded JS data blob
+def _scrape_layered(
+    *,
+    company: str,
+    html_url: str,
+    embedded_re: re.Pattern,
+    needles: tuple[str, ...],
+    make_link,
+    limit: int = 20,
+    api_urls: list[str] | None = None,
+    api_parse=None,
+    api_kwargs: dict | None = None,
+    html_headers: dict | None = None,
+    sentinel: bytes | None = None,
+    anchor_re: re.Pattern | None = None,
+    host_prefix: str = "",
+    refresh: bool = False,
+) -> list[Job]:
+    """
+    Layered scrape shared by every site:
+      Layer 1 → JSON API candidates, probed concurrently (if any)
+      Layer 2 → HTML page: JSON-LD, then embedded-JS regex, then <a> links
+
+    `make_link` turns the second embedded-regex group into an absolute
+    job link, or "" to drop the match. With `sentinel` the page is
+    streamed only up to the script holding it, and the JSON-LD layer is
+    skipped: any ld+json block after that point would be cut off, so
+    only use it for sites whose jobs live in the embedded script. The
+    anchor layer runs only when `anchor_re` is given. `refresh` bypasses
+    the response cache for this scrape's requests only.
+    """
+    jobs = []
+    # Per-request bypass: SESSION.cache_disabled() is process-wide and not thread-safe
+    cache_kwargs = {"expire_after": requests_cache.DO_NOT_CACHE} if refresh else {}
+
+    if api_urls:
+        jobs = _first_api_hit(company, api_urls, api_parse,
+                              **(api_kwargs or {}), **cache_kwargs)
         if not jobs:
-            for s in soup.find_all("script"):
-                if s.string and "job_id" in s.string:
-                    pairs = re.findall(
-                        r'"title"\s*:\s*"([^"]{5,80})".*?"job_id"\s*:\s*"([^"]+)"',
-                        s.string
-                    )
-                    for title, job_id in pairs[:30]:
-                        jobs.append({
-                            "company":  "Google",
-                            "title":    title,
-                            "location": "India",
-                            "link":     f"https://careers.google.com/jobs/results/{job_id}",
-                        })
+            print(f"[Scraper] {company} API failed — trying HTML fallback...")
+
+    if not jobs:
+        try:
+            if sentinel:
+                markup, charset = _fetch_until(html_url, sentinel)
+            else:
+                resp = SESSION.get(html_url, headers=html_headers, timeout=TIMEOUT,
+                                   **cache_kwargs)
+                markup, charset = resp.content, _charset(resp, resp.content)
+            ld_json, scripts, anchors = _parse_page(markup, charset)
+
+            # JSON-LD structured data (needs the full page)
+            if not sentinel:
+                jobs = _jsonld_jobs(ld_json, company)
+
+            # Embedded JS data blob
+            if not jobs:
+                for txt in _iter_interesting_scripts(scripts, needles):
+                    for title, ref in _scan_pairs(txt, embedded_re, limit):
+                        link = make_link(ref)
+                        if link:
+                            jobs.append(Job(company=company, title=title,
+                                            location="India", link=link))
                     if jobs:
                         break
 
-    except Exception as e:
-        print(f"[Scraper] Google failed: {e}")
+            # Generic anchor fallback
+            if not jobs and anchor_re is not None:
+                seen_links = set()
+                for a in anchors:
+                    href = a.get("href")
+                    text = "".join(t.strip() for t in a.itertext())
+                    if len(text) <= 8:
+                        continue
+                    href_l = href.lower()
+                    if anchor_re.search(href_l) and href_l not in seen_links:
+                        seen_links.add(href_l)
+                        full = href if href.startswith("http") else host_prefix + href
+                        jobs.append(Job(company=company, title=text,
+                                        location="India", link=full))
 
-    # Deduplicate
-    seen, unique = set(), []
-    for j in jobs:
-        if j["link"] not in seen:
-            seen.add(j["link"])
-            unique.append(j)
+        except Exception as e:
+            print(f"[Scraper] {company} HTML scrape failed: {e}")
 
-    print(f"[Scraper] Google → {len(unique)} jobs found")
-    return unique
+    print(f"[Scraper] {company} → {len(jobs)} jobs found")
+    return jobs
+
+
+# ─────────────────────────────────────────────────────────────────────
+# 1. GOOGLE  (working ✅ — keeping as-is)
+# ─────────────────────────────────────────────────────────────────────
+
+def scrape_google(refresh: bool = False) -> list[Job]:
+    """Scrape Google Careers via their public HTML page + embedded JSON."""
+    return _scrape_layered(
+        company     = "Google",
+        html_url    = "https://careers.google.com/jobs/results/?location=India&q=software+engineer+data+machine+learning",
+        embedded_re = _GOOGLE_JOB_RE,
+        needles     = ("job_id",),
+        limit       = 30,
+        make_link   = lambda job_id: f"https://careers.google.com/jobs/results/{job_id}",
+        refresh     = refresh,
+    )
 
 
 # ─────────────────────────────────────────────────────────────────────
 # 2. MICROSOFT  (fixed endpoint)
 # ─────────────────────────────────────────────────────────────────────
 
-def scrape_microsoft() -> list[dict]:
+def _parse_microsoft_api(resp) -> list[Job]:
+    """Build jobs from either Microsoft search endpoint (same shape)."""
+    print(f"[Scraper] Microsoft {resp.url.split('/')[2]} → status {resp.status_code}")
+    if resp.status_code != 200:
+        return []
+    try:
+        data = _json_loads(resp.content)
+    except ValueError:   # both json and orjson decode errors subclass it
+        return []
+
+    job_list = (
+        data.get("operationResult", {}).get("result", {}).get("jobs") or
+        data.get("jobs") or
+        data.get("value") or
+        []
+    )
+
+    jobs = []
+    for job in job_list:
+        title  = job.get("title", "")
+        loc    = job.get("location") or job.get("primaryLocation", "")
+        job_id = job.get("jobId") or job.get("id", "")
+        link   = f"https://jobs.careers.microsoft.com/global/en/job/{job_id}" if job_id else ""
+        if title and link:
+            jobs.append(Job(company="Microsoft", title=title,
+                            location=loc, link=link))
+    return jobs
+
+
+def scrape_microsoft(refresh: bool = False) -> list[Job]:
     """
     Microsoft's actual current API — confirmed working Feb 2025.
     Their SPA at jobs.careers.microsoft.com calls this endpoint.
     """
-    jobs = []
-
-    # Primary: new endpoint used by their careers SPA
-    primary_url = "https://jobs.careers.microsoft.com/global/en/search"
-    # Fallback: alternate path
-    fallback_url = "https://jobs.careers.microsoft.com/global/en/search"
-
     params = {
         "q":    "software engineer machine learning data",
         "l":    "en_us",
@@ -126,83 +445,56 @@ def scrape_microsoft() -> list[dict]:
         "flt":  True,
     }
 
-    # Try the direct API path their SPA uses internally
-    api_headers = {
-        **HEADERS,
-        "Referer": "https://jobs.careers.microsoft.com/",
-    }
+    return _scrape_layered(
+        company     = "Microsoft",
+        api_urls    = [
+            "https://jobs.careers.microsoft.com/global/en/search",
+            "https://gcsservices.careers.microsoft.com/search/api/v1/search",
+        ],
+        api_parse   = _parse_microsoft_api,
+        # Try the direct API path their SPA uses internally
+        api_kwargs  = {"params": params,
+                       "headers": {"Referer": "https://jobs.careers.microsoft.com/"}},
+        html_url    = "https://jobs.careers.microsoft.com/global/en/search?q=software+engineer&l=en_us",
+        sentinel    = b'"jobId"',
+        embedded_re = _MS_JOB_RE,
+        needles     = ("jobId",),
+        make_link   = lambda job_id: f"https://jobs.careers.microsoft.com/global/en/job/{job_id}",
+        refresh     = refresh,
+    )
 
-    for url in [
-        "https://jobs.careers.microsoft.com/global/en/search",
-        "https://gcsservices.careers.microsoft.com/search/api/v1/search",
-    ]:
-        try:
-            resp = requests.get(url, params=params, headers=api_headers, timeout=TIMEOUT)
-            print(f"[Scraper] Microsoft {url.split('/')[2]} → status {resp.status_code}")
-
-            if resp.status_code == 200:
-                try:
-                    data = resp.json()
-                except Exception:
-                    continue
-
-                # Both endpoints return same shape
-                job_list = (
-                    data.get("operationResult", {}).get("result", {}).get("jobs") or
-                    data.get("jobs") or
-                    data.get("value") or
-                    []
-                )
-
-                for job in job_list:
-                    title  = job.get("title", "")
-                    loc    = job.get("location") or job.get("primaryLocation", "")
-                    job_id = job.get("jobId") or job.get("id", "")
-                    link   = f"https://jobs.careers.microsoft.com/global/en/job/{job_id}" if job_id else ""
-                    if title and link:
-                        jobs.append({"company": "Microsoft", "title": title,
-                                     "location": loc, "link": link})
-                if jobs:
-                    break
 
-        except Exception as e:
-            print(f"[Scraper] Microsoft endpoint failed: {e}")
-            continue
+# ─────────────────────────────────────────────────────────────────────
+# 3. ZOMATO  (complete rewrite — custom careers portal)
+# ─────────────────────────────────────────────────────────────────────
 
-    # HTML fallback if both API endpoints fail
-    if not jobs:
-        print("[Scraper] Microsoft API failed — trying HTML fallback...")
-        try:
-            url  = "https://jobs.careers.microsoft.com/global/en/search?q=software+engineer&l=en_us"
-            resp = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            for s in soup.find_all("script"):
-                txt = s.string or ""
-                if "jobId" in txt and "title" in txt:
-                    # Extract from inline JS/JSON
-                    matches = re.findall(r'"title"\s*:\s*"([^"]+)"[^}]*"jobId"\s*:\s*"([^"]+)"', txt)
-                    for title, job_id in matches[:20]:
-                        jobs.append({
-                            "company":  "Microsoft",
-                            "title":    title,
-                            "location": "India",
-                            "link":     f"https://jobs.careers.microsoft.com/global/en/job/{job_id}",
-                        })
-                    if jobs:
-                        break
-        except Exception as e:
-            print(f"[Scraper] Microsoft HTML fallback failed: {e}")
+def _parse_zomato_api(resp) -> list[Job]:
+    """Build jobs from a Zomato careers API response, if it is JSON."""
+    ct = resp.headers.get("Content-Type", "")
+    if resp.status_code != 200 or "application/json" not in ct:
+        return []
+    data     = _json_loads(resp.content)
+    job_list = data.get("jobs") or data.get("results") or data.get("data") or []
 
-    print(f"[Scraper] Microsoft → {len(jobs)} jobs found")
+    jobs = []
+    for job in job_list:
+        title = job.get("title") or job.get("name", "")
+        loc   = job.get("location") or job.get("city", "India")
+        link  = job.get("url") or job.get("apply_url") or job.get("link", "")
+        if title and link:
+            jobs.append(Job(company="Zomato", title=title,
+                            location=loc, link=link))
     return jobs
 
 
-# ─────────────────────────────────────────────────────────────────────
-# 3. ZOMATO  (complete rewrite — custom careers portal)
-# ─────────────────────────────────────────────────────────────────────
+def _zomato_link(link: str) -> str:
+    """Absolute Zomato link for an embedded-JS match, or "" if off-site."""
+    if "zomato" in link.lower() or link.startswith("/"):
+        return link if link.startswith("http") else "https://www.zomato.com" + link
+    return ""
+
 
-def scrape_zomato() -> list[dict]:
+def scrape_zomato(refresh: bool = False) -> list[Job]:
     """
     Zomato uses their own custom careers portal at zomato.com/careers
     NOT Lever or Greenhouse.
@@ -210,8 +502,6 @@ def scrape_zomato() -> list[dict]:
     Their page is React-based. Job data is loaded via an internal API.
     We try the API first, then fall back to HTML parse.
     """
-    jobs = []
-
     # Layer 1: Try Zomato's internal jobs API
     # (inspected from browser XHR calls on their careers page)
     api_candidates = [
@@ -220,94 +510,47 @@ def scrape_zomato() -> list[dict]:
         "https://api.zomato.com/careers/jobs",
     ]
 
-    for api_url in api_candidates:
-        try:
-            resp = requests.get(api_url, headers=HEADERS, timeout=TIMEOUT)
-            if resp.status_code == 200 and "application/json" in resp.headers.get("Content-Type", ""):
-                data     = resp.json()
-                job_list = data.get("jobs") or data.get("results") or data.get("data") or []
-                for job in job_list:
-                    title = job.get("title") or job.get("name", "")
-                    loc   = job.get("location") or job.get("city", "India")
-                    link  = job.get("url") or job.get("apply_url") or job.get("link", "")
-                    if title and link:
-                        jobs.append({"company": "Zomato", "title": title,
-                                     "location": loc, "link": link})
-                if jobs:
-                    print(f"[Scraper] Zomato API hit: {api_url}")
-                    break
-        except Exception:
-            pass
+    return _scrape_layered(
+        company      = "Zomato",
+        api_urls     = api_candidates,
+        api_parse    = _parse_zomato_api,
+        html_url     = "https://www.zomato.com/careers",
+        html_headers = {"Accept": "text/html"},
+        embedded_re  = _ZOMATO_JOB_RE,
+        needles      = ("jobTitle", "applyUrl"),
+        make_link    = _zomato_link,
+        anchor_re    = _ZOMATO_ANCHOR_RE,
+        host_prefix  = "https://www.zomato.com",
+        refresh      = refresh,
+    )
 
-    # Layer 2: HTML scrape of their careers page
-    if not jobs:
-        try:
-            resp = requests.get(
-                "https://www.zomato.com/careers",
-                headers={**HEADERS, "Accept": "text/html"},
-                timeout=TIMEOUT
-            )
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            # Try JSON-LD
-            for s in soup.find_all("script", type="application/ld+json"):
-                try:
-                    data  = json.loads(s.string or "")
-                    items = data if isinstance(data, list) else [data]
-                    for item in items:
-                        if item.get("@type") == "JobPosting":
-                            jobs.append({
-                                "company":  "Zomato",
-                                "title":    item.get("title", ""),
-                                "location": "India",
-                                "link":     item.get("url", ""),
-                            })
-                except Exception:
-                    pass
-
-            # Try embedded JSON data blob
-            if not jobs:
-                for s in soup.find_all("script"):
-                    txt = s.string or ""
-                    if "jobTitle" in txt or ("title" in txt and "applyUrl" in txt):
-                        # Look for job arrays in JS
-                        raw_jobs = re.findall(
-                            r'\{[^{}]*"title"\s*:\s*"([^"]{4,80})"[^{}]*"(?:url|link|applyUrl)"\s*:\s*"([^"]+)"[^{}]*\}',
-                            txt
-                        )
-                        for title, link in raw_jobs[:20]:
-                            if "zomato" in link.lower() or link.startswith("/"):
-                                full = link if link.startswith("http") else "https://www.zomato.com" + link
-                                jobs.append({"company": "Zomato", "title": title,
-                                             "location": "India", "link": full})
-                        if jobs:
-                            break
 
-            # Generic anchor fallback
-            if not jobs:
-                seen_links = set()
-                for a in soup.find_all("a", href=True):
-                    href = a["href"]
-                    text = a.get_text(strip=True)
-                    if (len(text) > 8 and href not in seen_links and
-                            any(kw in href.lower() for kw in ["career", "job", "opening", "role"])):
-                        seen_links.add(href)
-                        full = href if href.startswith("http") else "https://www.zomato.com" + href
-                        jobs.append({"company": "Zomato", "title": text,
-                                     "location": "India", "link": full})
+# ─────────────────────────────────────────────────────────────────────
+# 4. SWIGGY  (complete rewrite — custom careers portal)
+# ─────────────────────────────────────────────────────────────────────
 
-        except Exception as e:
-            print(f"[Scraper] Zomato HTML scrape failed: {e}")
+def _parse_swiggy_api(resp) -> list[Job]:
+    """Build jobs from a Swiggy careers API response, if it is JSON."""
+    ct = resp.headers.get("Content-Type", "")
+    if resp.status_code != 200 or "json" not in ct:
+        return []
+    data     = _json_loads(resp.content)
+    job_list = data if isinstance(data, list) else (
+        data.get("jobs") or data.get("results") or data.get("data") or []
+    )
 
-    print(f"[Scraper] Zomato → {len(jobs)} jobs found")
+    jobs = []
+    for job in job_list:
+        title = job.get("title") or job.get("name", "")
+        loc   = job.get("location") or job.get("City", "India")
+        link  = job.get("job_application_url") or job.get("url") or job.get("link", "")
+        if title and link:
+            jobs.append(Job(company="Swiggy", title=title,
+                            location=loc, link=link))
     return jobs
 
 
-# ─────────────────────────────────────────────────────────────────────
-# 4. SWIGGY  (complete rewrite — custom careers portal)
-# ─────────────────────────────────────────────────────────────────────
-
-def scrape_swiggy() -> list[dict]:
+def scrape_swiggy(refresh: bool = False) -> list[Job]:
     """
     Swiggy uses their own careers portal at careers.swiggy.com
     NOT Greenhouse as previously assumed.
@@ -316,8 +559,6 @@ def scrape_swiggy() -> list[dict]:
     Confirmed URL structure from their HTML template:
       careers.swiggy.com/list.html  →  fetches from an internal API
     """
-    jobs = []
-
     # Layer 1: Try Swiggy's internal jobs API
     # Their careers page template shows {{n.title}}, {{n.job_application_url}}
     # meaning it's Angular/Vue loaded from a JSON endpoint
@@ -327,98 +568,74 @@ def scrape_swiggy() -> list[dict]:
         "https://www.swiggy.com/careers/api/jobs",
     ]
 
-    for api_url in swiggy_api_candidates:
-        try:
-            resp = requests.get(api_url, headers=HEADERS, timeout=TIMEOUT)
-            if resp.status_code == 200 and "json" in resp.headers.get("Content-Type", ""):
-                data     = resp.json()
-                job_list = data if isinstance(data, list) else (
-                    data.get("jobs") or data.get("results") or data.get("data") or []
-                )
-                for job in job_list:
-                    title = job.get("title") or job.get("name", "")
-                    loc   = job.get("location") or job.get("City", "India")
-                    link  = job.get("job_application_url") or job.get("url") or job.get("link", "")
-                    if title and link:
-                        jobs.append({"company": "Swiggy", "title": title,
-                                     "location": loc, "link": link})
-                if jobs:
-                    print(f"[Scraper] Swiggy API hit: {api_url}")
-                    break
-        except Exception:
-            pass
+    return _scrape_layered(
+        company      = "Swiggy",
+        api_urls     = swiggy_api_candidates,
+        api_parse    = _parse_swiggy_api,
+        html_url     = "https://careers.swiggy.com",
+        html_headers = {"Accept": "text/html"},
+        embedded_re  = _SWIGGY_JOB_RE,
+        needles      = ("job_application_url",),
+        make_link    = lambda link: link,
+        anchor_re    = _SWIGGY_ANCHOR_RE,
+        host_prefix  = "https://careers.swiggy.com",
+        refresh      = refresh,
+    )
 
-    # Layer 2: HTML parse of careers.swiggy.com
-    if not jobs:
-        try:
-            resp = requests.get(
-                "https://careers.swiggy.com",
-                headers={**HEADERS, "Accept": "text/html"},
-                timeout=TIMEOUT
-            )
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            # JSON-LD
-            for s in soup.find_all("script", type="application/ld+json"):
-                try:
-                    data  = json.loads(s.string or "")
-                    items = data if isinstance(data, list) else [data]
-                    for item in items:
-                        if item.get("@type") == "JobPosting":
-                            jobs.append({
-                                "company":  "Swiggy",
-                                "title":    item.get("title", ""),
-                                "location": "India",
-                                "link":     item.get("url", ""),
-                            })
-                except Exception:
-                    pass
-
-            # Embedded JS data
-            if not jobs:
-                for s in soup.find_all("script"):
-                    txt = s.string or ""
-                    if "job_application_url" in txt or ("title" in txt and "Department" in txt):
-                        raw = re.findall(
-                            r'"title"\s*:\s*"([^"]+)"[^}]*"job_application_url"\s*:\s*"([^"]+)"',
-                            txt
-                        )
-                        for title, link in raw[:20]:
-                            jobs.append({"company": "Swiggy", "title": title,
-                                         "location": "India", "link": link})
-                        if jobs:
-                            break
 
-            # Generic anchor fallback
-            if not jobs:
-                seen_links = set()
-                for a in soup.find_all("a", href=True):
-                    href = a["href"]
-                    text = a.get_text(strip=True)
-                    if (len(text) > 8 and href not in seen_links and
-                            any(kw in href.lower() for kw in ["job", "career", "opening", "apply"])):
-                        seen_links.add(href)
-                        full = href if href.startswith("http") else "https://careers.swiggy.com" + href
-                        jobs.append({"company": "Swiggy", "title": text,
-                                     "location": "India", "link": full})
+# ─────────────────────────────────────────────────────────────────────
+# ENTRY POINT
+# ─────────────────────────────────────────────────────────────────────
 
-        except Exception as e:
-            print(f"[Scraper] Swiggy HTML scrape failed: {e}")
+# Query parameters that only track the click; everything else may be a job ID.
+_TRACKING_PARAMS = frozenset({"gclid", "fbclid", "mc_cid", "mc_eid"})
 
-    print(f"[Scraper] Swiggy → {len(jobs)} jobs found")
-    return jobs
 
+def _canonical_link(link: str) -> str:
+    """
+    Normalise a job link for dedup: lowercase scheme/host/path, drop the
+    trailing slash, fragment and tracking parameters (utm_*, gclid, ...).
+    The rest of the query is kept, since these sites often put the job
+    ID there (/careers/1?id=1 vs ?id=2).
+    """
+    parts = urlsplit(link)
+    query = urlencode([
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    ])
+    path  = parts.path.rstrip("/").lower()
+    base  = f"{parts.scheme}://{parts.netloc}".lower() if parts.netloc else ""
+    return base + path + (f"?{query}" if query else "")
 
-# ─────────────────────────────────────────────────────────────────────
-# ENTRY POINT
-# ─────────────────────────────────────────────────────────────────────
 
-def scrape_all() -> list[dict]:
-    """Run all scrapers and return combined list."""
-    all_jobs = []
-    all_jobs.extend(scrape_google())
-    all_jobs.extend(scrape_microsoft())
-    all_jobs.extend(scrape_zomato())
-    all_jobs.extend(scrape_swiggy())
-    print(f"\n[Scraper] Total raw jobs fetched: {len(all_jobs)}")
-    return all_jobs
+SCRAPERS = (scrape_google, scrape_microsoft, scrape_zomato, scrape_swiggy)
+
+
+def scrape_all(refresh: bool = False) -> Iterator[Job]:
+    """
+    Run all scrapers concurrently and yield deduplicated jobs as each
+    scraper finishes, so callers can filter / save / alert while the
+    slower sites are still downloading.
+    Every scraper is network-bound, so threads cut wall time from the
+    sum of the four sites' latencies to roughly the slowest one.
+    Pass refresh=True to bypass the response cache and hit every site live.
+    """
+    # Single cross-source dedup pass, keyed on the canonical link
+    seen: set[str] = set()
+    pool    = ThreadPoolExecutor(max_workers=len(SCRAPERS))
+    futures = [pool.submit(scrape, refresh) for scrape in SCRAPERS]
+    try:
+        for fut in as_completed(futures):
+            for j in fut.result():
+                key = _canonical_link(j.link)
+                if key and key not in seen:
+                    seen.add(key)
+                    yield j
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    print(f"\n[Scraper] Total unique jobs fetched: {len(seen)}")
+
+
+def scrape_all_list(refresh: bool = False) -> list[Job]:
+    """Run all scrapers and return the combined, deduplicated list."""
+    return list(scrape_all(refresh))